@@ -5,11 +5,17 @@ Author: Created for mneudobno
 Date: 2025-03-20
 """
 
+import asyncio
+import atexit
+import heapq
 import logging
 import os
+import queue
 import time
 import json
-import requests
+import aiohttp
+import cachetools
+import msgspec
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     ApplicationBuilder,
@@ -17,23 +23,33 @@ from telegram.ext import (
     MessageHandler,
     CallbackQueryHandler,
     ContextTypes,
+    Defaults,
     filters,
     ConversationHandler,
 )
 import transmission_rpc
-from typing import Dict, List
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, NamedTuple
 from datetime import datetime
 
-# Configure enhanced logging
+# Configure enhanced logging. Handlers run on a background thread via a
+# queue so disk writes (slow on SD cards) never block the event loop.
 log_format = '%(asctime)s - %(name)s - %(levelname)s - [%(funcName)s:%(lineno)d] - %(message)s'
+_log_formatter = logging.Formatter(log_format)
+_file_handler = logging.FileHandler("/home/pi/dev/telegram_transmission/bot.log")
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue: queue.Queue = queue.Queue(-1)
 logging.basicConfig(
-    format=log_format,
     level=logging.INFO,
-    handlers=[
-        logging.FileHandler("/home/pi/dev/telegram_transmission/bot.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
 # States for conversation
@@ -52,126 +68,255 @@ JACKETT_API_KEY = os.environ.get('JACKETT_API_KEY', '')
 # Telegram token
 TELEGRAM_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN', '')
 
-# Parse allowed users from env var (comma-separated list)
+# Parse allowed users from env var (comma-separated list); frozenset for O(1) lookup
 allowed_users_str = os.environ.get('ALLOWED_TELEGRAM_USERS', '')
-ALLOWED_USERS = [int(user_id.strip()) for user_id in allowed_users_str.split(',') if user_id.strip()]
+ALLOWED_USERS: frozenset[int] = frozenset(
+    int(user_id.strip()) for user_id in allowed_users_str.split(',') if user_id.strip()
+)
+
+# Typed views of the Jackett response; msgspec decodes straight into these
+# structs, skipping the intermediate dicts (unknown fields are ignored)
+class JackettResult(msgspec.Struct):
+    Title: str = 'Unknown'
+    Size: int = 0
+    Seeders: int = 0
+    Peers: int = 0
+    Tracker: str = 'Unknown'
+    MagnetUri: str | None = None
+    Link: str | None = None
+
+class JackettResponse(msgspec.Struct):
+    Results: list[JackettResult] = []
+
+_jackett_decoder = msgspec.json.Decoder(JackettResponse)
+
+# A single formatted Jackett search result
+class TorrentRow(NamedTuple):
+    title: str
+    size: int
+    seeds: int
+    peers: int
+    tracker: str
+    magnet: str
+
+# Per-user search results, bounded with a TTL so abandoned searches expire
+search_results_cache: cachetools.TTLCache = cachetools.TTLCache(maxsize=1024, ttl=900)
+
+# TTL cache for Jackett results keyed by normalized query, with per-key locks
+# so concurrent identical searches coalesce into a single upstream request
+jackett_cache: cachetools.TTLCache = cachetools.TTLCache(maxsize=256, ttl=300)
+jackett_cache_locks: Dict[str, asyncio.Lock] = {}
+
+# Shared HTTP session for Jackett requests (created lazily on first search)
+http_session: aiohttp.ClientSession | None = None
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use"""
+    global http_session
+    if http_session is None or http_session.closed:
+        logger.info("Creating shared aiohttp session")
+        http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300, keepalive_timeout=60),
+            headers={"Accept-Encoding": "gzip"},
+        )
+    return http_session
+
+async def close_http_session(application) -> None:
+    """Close the shared aiohttp session on bot shutdown"""
+    if http_session is not None and not http_session.closed:
+        logger.info("Closing shared aiohttp session")
+        await http_session.close()
+
+# Outgoing Telegram calls are funnelled through a single queue so bursts of
+# concurrent handlers stay under Telegram's ~30 msg/s bot-wide send limit
+SEND_RATE = 25  # messages per second
+send_queue: asyncio.Queue = asyncio.Queue()
 
-# Cache for search results
-search_results_cache: Dict[int, List[Dict]] = {}
+async def send_throttled(method, *args, **kwargs):
+    """Enqueue an outgoing Telegram call and wait for its result"""
+    future = asyncio.get_running_loop().create_future()
+    await send_queue.put((future, method, args, kwargs))
+    return await future
 
-# Function to check if a user is allowed
-def is_user_allowed(user_id):
-    return user_id in ALLOWED_USERS
+async def sender_worker():
+    """Drain the send queue at a bounded rate"""
+    interval = 1 / SEND_RATE
+    while True:
+        future, method, args, kwargs = await send_queue.get()
+        try:
+            result = await method(*args, **kwargs)
+            if not future.cancelled():
+                future.set_result(result)
+        except Exception as e:
+            if not future.cancelled():
+                future.set_exception(e)
+        await asyncio.sleep(interval)
+
+async def start_sender(application) -> None:
+    """Launch the outgoing-message worker on bot startup"""
+    application.create_task(sender_worker())
 
 # Middleware to check user permissions
 async def check_user(update: Update):
     user_id = update.effective_user.id
     username = update.effective_user.username
-    logger.info(f"Access attempt by user: {username} (ID: {user_id})")
-    
-    if not is_user_allowed(user_id):
-        logger.warning(f"Unauthorized access attempt by user: {username} (ID: {user_id})")
-        await update.message.reply_text("Sorry, you are not authorized to use this bot.")
+    logger.info("Access attempt by user: %s (ID: %s)", username, user_id)
+
+    if user_id not in ALLOWED_USERS:
+        logger.warning("Unauthorized access attempt by user: %s (ID: %s)", username, user_id)
+        await send_throttled(update.message.reply_text, "Sorry, you are not authorized to use this bot.")
         return False
     
-    logger.info(f"Authorized access by user: {username} (ID: {user_id})")
+    logger.info("Authorized access by user: %s (ID: %s)", username, user_id)
     return True
 
-# Initialize Transmission client
-def init_transmission():
-    logger.info(f"Initializing Transmission client at {TRANSMISSION_HOST}:{TRANSMISSION_PORT}")
-    try:
-        client = transmission_rpc.Client(
-            host=TRANSMISSION_HOST,
-            port=TRANSMISSION_PORT,
-            username=TRANSMISSION_USER,
-            password=TRANSMISSION_PASSWORD
-        )
-        logger.info("Successfully connected to Transmission")
-        return client
-    except Exception as e:
-        logger.error(f"Failed to connect to Transmission: {e}")
-        raise
+# Shared Transmission client (created lazily, reused across handlers)
+_transmission_client: transmission_rpc.Client | None = None
+_transmission_lock = asyncio.Lock()
+
+async def get_transmission() -> transmission_rpc.Client:
+    """Return the shared Transmission client, connecting on first use"""
+    global _transmission_client
+    if _transmission_client is not None:
+        return _transmission_client
+
+    async with _transmission_lock:
+        # Another coroutine may have connected while we waited
+        if _transmission_client is not None:
+            return _transmission_client
+
+        logger.info("Initializing Transmission client at %s:%s", TRANSMISSION_HOST, TRANSMISSION_PORT)
+        try:
+            _transmission_client = transmission_rpc.Client(
+                host=TRANSMISSION_HOST,
+                port=TRANSMISSION_PORT,
+                username=TRANSMISSION_USER,
+                password=TRANSMISSION_PASSWORD
+            )
+            logger.info("Successfully connected to Transmission")
+            return _transmission_client
+        except Exception as e:
+            logger.error("Failed to connect to Transmission: %s", e)
+            raise
+
+def reset_transmission():
+    """Drop the shared client so the next call reconnects"""
+    global _transmission_client
+    _transmission_client = None
 
 # Jackett search function
 async def search_jackett(query):
     """Search for torrents using Jackett API"""
-    logger.info(f"Searching Jackett for: {query}")
+    logger.info("Searching Jackett for: %s", query)
     try:
-        # Prepare parameters
+        # Prepare parameters (no Category filter means all categories)
         params = {
             "apikey": JACKETT_API_KEY,
             "Query": query,
-            "Category": []  # Empty list means all categories
         }
         
         # Make request to Jackett
         url = f"{JACKETT_URL}/api/v2.0/indexers/all/results"
-        response = requests.get(url, params=params)
-        
-        if response.status_code != 200:
-            logger.error(f"Jackett API error: {response.status_code} - {response.text}")
-            return []
-        
-        data = response.json()
-        results = data.get('Results', [])
-        logger.info(f"Found {len(results)} results from Jackett")
-        
-        # Sort results by seeders (highest first)
-        results = sorted(results, key=lambda x: x.get('Seeders', 0), reverse=True)
+        session = await get_http_session()
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            if response.status != 200:
+                logger.error("Jackett API error: %s - %s", response.status, await response.text())
+                return []
+
+            # msgspec decodes the large Results array directly into structs
+            data = _jackett_decoder.decode(await response.read())
+        results = data.Results
+        logger.info("Found %d results from Jackett", len(results))
+
+        # Keep only the 10 best-seeded results; avoids sorting the full list
+        top_results = heapq.nlargest(10, results, key=lambda x: x.Seeders)
         # Format results
         formatted_results = []
-        for result in results[:10]:  # Limit to 10 results
-            # Get magnet link or download link
-            magnet = result.get('MagnetUri', '')
-            if not magnet and 'Link' in result:
-                magnet = result.get('Link', '')
-                
-            formatted_results.append({
-                'id': result.get('Guid', ''),
-                'title': result.get('Title', 'Unknown'),
-                'size': result.get('Size', 0),
-                'seeds': result.get('Seeders', 0),
-                'peers': result.get('Peers', 0),
-                'magnet': magnet,
-                'tracker': result.get('Tracker', 'Unknown')
-            })
+        for result in top_results:
+            # Prefer the magnet link, fall back to the download link
+            magnet = result.MagnetUri or result.Link or ''
+
+            formatted_results.append(TorrentRow(
+                title=result.Title,
+                size=result.Size,
+                seeds=result.Seeders,
+                peers=result.Peers,
+                tracker=result.Tracker,
+                magnet=magnet,
+            ))
             
         return formatted_results
         
     except Exception as e:
-        logger.error(f"Error searching with Jackett: {e}", exc_info=True)
+        logger.error("Error searching with Jackett: %s", e, exc_info=True)
         return []
 
+# Cached Jackett search with request coalescing
+async def search_jackett_cached(query):
+    """Search Jackett through a TTL cache keyed by normalized query"""
+    key = query.strip().casefold()
+
+    if key in jackett_cache:
+        logger.info("Jackett cache hit for: %s", query)
+        return jackett_cache[key]
+
+    # Per-key lock so concurrent identical queries share one upstream request
+    lock = jackett_cache_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another coroutine may have filled the cache while we waited
+        if key in jackett_cache:
+            return jackett_cache[key]
+
+        results = await search_jackett(query)
+        if results:
+            jackett_cache[key] = results
+
+    # Drop the lock once the request has completed; waiters keep their reference
+    jackett_cache_locks.pop(key, None)
+    return results
+
+# Size units table: (suffix, bit shift) per power of 1024
+_SIZE_UNITS = (('B', 0), ('KB', 10), ('MB', 20), ('GB', 30), ('TB', 40))
+
+# Status emoji lookup for the /status listing
+STATUS_EMOJI = {
+    'downloading': "⬇️",
+    'seeding': "⬆️",
+    'stopped': "⏹️",
+    'checking': "🔍",
+}
+
 # Format file size to human-readable format
 def format_size(size_bytes):
     """Format size in bytes to human readable format"""
+    size_bytes = int(size_bytes)
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes/1024:.2f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes/(1024*1024):.2f} MB"
-    else:
-        return f"{size_bytes/(1024*1024*1024):.2f} GB"
+    # bit_length picks the power-of-1024 bucket without cascaded comparisons
+    index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    unit, shift = _SIZE_UNITS[index]
+    return f"{size_bytes / (1 << shift):.2f} {unit}"
+
+# Static message texts, built once at import time
+_START_MESSAGE = ('Hi! I can help you search for torrents and add them to Transmission.\n\n'
+                  'Send me a search query to get started.\n\n'
+                  'Commands:\n'
+                  '/start - Start the bot\n'
+                  '/cancel - Cancel current operation\n'
+                  '/status - Check Transmission status')
+
+_STATUS_HEADER = "📥 Current Transmission Torrents:\n\n"
 
 # Define command handlers
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     # Check if user is allowed
     if not await check_user(update):
         return ConversationHandler.END
-    
+
     username = update.effective_user.username
-    logger.info(f"Start command received from {username}")
-    
-    message = ('Hi! I can help you search for torrents and add them to Transmission.\n\n'
-               'Send me a search query to get started.\n\n'
-               'Commands:\n'
-               '/start - Start the bot\n'
-               '/cancel - Cancel current operation\n'
-               '/status - Check Transmission status')
-    
-    await update.message.reply_text(message)
+    logger.info("Start command received from %s", username)
+
+    await send_throttled(update.message.reply_text, _START_MESSAGE)
     return SEARCH
 
 async def search_torrent(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
@@ -183,18 +328,18 @@ async def search_torrent(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     user_id = update.effective_user.id
     username = update.effective_user.username
     
-    logger.info(f"Search query received from {username}: '{query}'")
+    logger.info("Search query received from %s: %r", username, query)
     
     # Send a "searching" message
-    search_message = await update.message.reply_text(f"🔎 Searching for: {query}...")
+    search_message = await send_throttled(update.message.reply_text, f"🔎 Searching for: {query}...")
     
     try:
-        # Search for torrents using Jackett
-        results = await search_jackett(query)
+        # Search for torrents using Jackett (cached)
+        results = await search_jackett_cached(query)
         
         if not results:
-            logger.info(f"No search results found for query: '{query}'")
-            await search_message.edit_text(
+            logger.info("No search results found for query: %r", query)
+            await send_throttled(search_message.edit_text,
                 "No results found. Please try a different search term."
             )
             return SEARCH
@@ -205,34 +350,35 @@ async def search_torrent(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         # Create keyboard with search results
         keyboard = []
         for i, torrent in enumerate(results):
-            # Format size
-            size_str = format_size(torrent.get('size', 0))
-                
-            # Format button text: Title (Size) [Tracker] - Seeds/Peers
-            button_text = f"{i+1}. {torrent.get('title', 'Unknown')} ({size_str}) [{torrent.get('tracker', '?')}] - {torrent.get('seeds', '?')}/{torrent.get('peers', '?')}"
-            
-            # Log each result
-            logger.debug(f"Result {i+1}: {torrent.get('title', 'Unknown')}")
-            
-            # Truncate button text if too long
-            if len(button_text) > 80:
-                button_text = button_text[:77] + "..."
-                
-            keyboard.append([InlineKeyboardButton(button_text, callback_data=str(i))])
+            # Button text: Title (Size) [Tracker] - Seeds/Peers, capped at 80 chars.
+            # Only the title is truncated so size/tracker/seeds stay readable.
+            prefix = f"{i+1}. "
+            tail = f" ({format_size(torrent.size)}) [{torrent.tracker}] - {torrent.seeds}/{torrent.peers}"
+
+            # Log each result (guarded: skipped entirely at INFO and above)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result %d: %s", i + 1, torrent.title)
+
+            title = torrent.title
+            budget = 80 - len(prefix) - len(tail)
+            if len(title) > budget:
+                title = title[:budget - 3] + "..."
+
+            keyboard.append([InlineKeyboardButton(f"{prefix}{title}{tail}", callback_data=str(i))])
         
         keyboard.append([InlineKeyboardButton("Cancel", callback_data="cancel")])
         reply_markup = InlineKeyboardMarkup(keyboard)
         
-        logger.info(f"Sending search results to user {username}")
-        await search_message.edit_text(
+        logger.info("Sending search results to user %s", username)
+        await send_throttled(search_message.edit_text,
             "Please select a torrent to download:",
             reply_markup=reply_markup
         )
         return SELECT_TORRENT
         
     except Exception as e:
-        logger.error(f"Error searching torrents: {e}", exc_info=True)
-        await search_message.edit_text(
+        logger.error("Error searching torrents: %s", e, exc_info=True)
+        await send_throttled(search_message.edit_text,
             f"❌ An error occurred while searching: {str(e)[:200]}... Please try again later."
         )
         return SEARCH
@@ -244,8 +390,8 @@ async def select_torrent(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     username = update.effective_user.username
     
     if query.data == "cancel":
-        logger.info(f"User {username} cancelled the search")
-        await query.edit_message_text("Search cancelled. Send me a new search query.")
+        logger.info("User %s cancelled the search", username)
+        await send_throttled(query.edit_message_text, "Search cancelled. Send me a new search query.")
         return SEARCH
     
     try:
@@ -254,43 +400,48 @@ async def select_torrent(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         user_results = search_results_cache.get(user_id, [])
         
         if not user_results or torrent_index >= len(user_results):
-            logger.warning(f"User {username} made invalid selection: {query.data}")
-            await query.edit_message_text("Invalid selection. Please try searching again.")
+            logger.warning("User %s made invalid selection: %s", username, query.data)
+            await send_throttled(query.edit_message_text, "Invalid selection. Please try searching again.")
             return SEARCH
         
+        # Unpack the selected row once; fields are reused across both messages
         selected_torrent = user_results[torrent_index]
-        torrent_title = selected_torrent.get('title', 'Unknown')
-        magnet_link = selected_torrent.get('magnet', '')
-        
+        torrent_title, torrent_size, torrent_tracker, magnet_link = (
+            selected_torrent.title,
+            selected_torrent.size,
+            selected_torrent.tracker,
+            selected_torrent.magnet,
+        )
+
         if not magnet_link:
-            logger.error(f"No magnet link found for torrent: {torrent_title}")
-            await query.edit_message_text("❌ No magnet link found for this torrent. Please try another one.")
+            logger.error("No magnet link found for torrent: %s", torrent_title)
+            await send_throttled(query.edit_message_text, "❌ No magnet link found for this torrent. Please try another one.")
             return SEARCH
         
-        logger.info(f"User {username} selected torrent: '{torrent_title}'")
+        logger.info("User %s selected torrent: %r", username, torrent_title)
         
         # Send message that we're adding the torrent
-        await query.edit_message_text(f"⏳ Adding torrent to Transmission: {torrent_title}...")
+        await send_throttled(query.edit_message_text, f"⏳ Adding torrent to Transmission: {torrent_title}...")
         
-        # Initialize Transmission client
-        transmission_client = init_transmission()
-        
-        # Add the torrent to Transmission
-        logger.info(f"Adding torrent to Transmission: '{torrent_title}'")
-        transmission_client.add_torrent(magnet_link)
+        # Get the shared Transmission client
+        transmission_client = await get_transmission()
+
+        # Add the torrent to Transmission (blocking RPC call, run in a thread)
+        logger.info("Adding torrent to Transmission: %r", torrent_title)
+        await asyncio.to_thread(transmission_client.add_torrent, magnet_link)
         
         # Get current date and time for the log
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         # Log the successful addition
-        logger.info(f"Successfully added torrent to Transmission at {now}: '{torrent_title}'")
+        logger.info("Successfully added torrent to Transmission at %s: %r", now, torrent_title)
         
         # Send confirmation
-        await query.edit_message_text(
+        await send_throttled(query.edit_message_text,
             f"✅ Torrent added to Transmission!\n\n"
             f"Title: {torrent_title}\n"
-            f"Size: {format_size(selected_torrent.get('size', 0))}\n"
-            f"Tracker: {selected_torrent.get('tracker', 'Unknown')}\n"
+            f"Size: {format_size(torrent_size)}\n"
+            f"Tracker: {torrent_tracker}\n"
             f"Added at: {now}"
         )
         
@@ -300,87 +451,128 @@ async def select_torrent(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return SEARCH
         
     except transmission_rpc.error.TransmissionError as e:
-        logger.error(f"Transmission error: {e}", exc_info=True)
-        await query.edit_message_text(f"❌ Failed to add torrent to Transmission: {str(e)[:200]}... Please try again later.")
+        logger.error("Transmission error: %s", e, exc_info=True)
+        reset_transmission()
+        await send_throttled(query.edit_message_text, f"❌ Failed to add torrent to Transmission: {str(e)[:200]}... Please try again later.")
         return SEARCH
     except Exception as e:
-        logger.error(f"Error selecting torrent: {e}", exc_info=True)
-        await query.edit_message_text(f"❌ An error occurred while processing your selection: {str(e)[:200]}... Please try again.")
+        logger.error("Error selecting torrent: %s", e, exc_info=True)
+        await send_throttled(query.edit_message_text, f"❌ An error occurred while processing your selection: {str(e)[:200]}... Please try again.")
         return SEARCH
 
+# Number of torrents shown per /status page
+STATUS_PAGE_SIZE = 5
+
+def format_torrent_entry(index, torrent):
+    """Format a single torrent for the /status listing"""
+    # Get status and its emoji
+    status = torrent.status
+    emoji = STATUS_EMOJI.get(status, "❓")
+
+    name = torrent.name
+
+    # One f-string per entry instead of repeated += string rebuilding
+    return (
+        f"{index}. {emoji} {name[:40]}{'...' if len(name) > 40 else ''}\n"
+        f"   • Status: {status.capitalize()} ({torrent.percent_done * 100:.1f}%)\n"
+        f"   • Size: {format_size(torrent.total_size)}\n"
+        f"   • Speed: ⬇️ {format_size(torrent.rate_download)}/s ⬆️ {format_size(torrent.rate_upload)}/s\n\n"
+    )
+
+def build_status_page(entries, page):
+    """Build the message text and pager keyboard for one /status page"""
+    num_pages = (len(entries) + STATUS_PAGE_SIZE - 1) // STATUS_PAGE_SIZE
+    page = max(0, min(page, num_pages - 1))
+    start = page * STATUS_PAGE_SIZE
+
+    message = _STATUS_HEADER + ''.join(entries[start:start + STATUS_PAGE_SIZE])
+
+    if num_pages == 1:
+        return message, None
+
+    message += f"Page {page + 1}/{num_pages}"
+    buttons = []
+    if page > 0:
+        buttons.append(InlineKeyboardButton("⬅️ Prev", callback_data=f"status_page:{page - 1}"))
+    if page < num_pages - 1:
+        buttons.append(InlineKeyboardButton("Next ➡️", callback_data=f"status_page:{page + 1}"))
+    return message, InlineKeyboardMarkup([buttons])
+
 async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Show status of Transmission torrents"""
     # Check if user is allowed
     if not await check_user(update):
         return ConversationHandler.END
-    
+
     username = update.effective_user.username
-    logger.info(f"Status command received from {username}")
-    
+    logger.info("Status command received from %s", username)
+
     try:
-        # Initialize Transmission client
-        transmission_client = init_transmission()
-        
-        # Get all torrents
-        torrents = transmission_client.get_torrents()
-        
+        # Get the shared Transmission client
+        transmission_client = await get_transmission()
+
+        # Get all torrents (blocking RPC call, run in a thread)
+        torrents = await asyncio.to_thread(transmission_client.get_torrents)
+
         if not torrents:
-            await update.message.reply_text("No torrents in Transmission.")
+            await send_throttled(update.message.reply_text, "No torrents in Transmission.")
             return SEARCH
-        
-        # Create status message
-        message = "📥 Current Transmission Torrents:\n\n"
-        
-        for i, torrent in enumerate(torrents[:10], 1):  # Limit to 10 torrents
-            # Calculate percentage
-            percent_done = torrent.percent_done * 100
-            
-            # Get status
-            status = torrent.status
-            
-            # Create status emoji
-            if status == 'downloading':
-                emoji = "⬇️"
-            elif status == 'seeding':
-                emoji = "⬆️"
-            elif status == 'stopped':
-                emoji = "⏹️"
-            elif status == 'checking':
-                emoji = "🔍"
-            else:
-                emoji = "❓"
-            
-            # Format size
-            size_bytes = torrent.total_size
-            size_str = format_size(size_bytes)
-            
-            # Add to message
-            message += f"{i}. {emoji} {torrent.name[:40]}{'...' if len(torrent.name) > 40 else ''}\n"
-            message += f"   • Status: {status.capitalize()} ({percent_done:.1f}%)\n"
-            message += f"   • Size: {size_str}\n"
-            message += f"   • Speed: ⬇️ {format_size(torrent.rate_download)}/s ⬆️ {format_size(torrent.rate_upload)}/s\n\n"
-        
-        if len(torrents) > 10:
-            message += f"...and {len(torrents) - 10} more torrents."
-        
-        await update.message.reply_text(message)
+
+        # Render all entries once and page through them via callbacks
+        entries = [format_torrent_entry(i, t) for i, t in enumerate(torrents, 1)]
+        context.user_data['status_entries'] = entries
+
+        message, reply_markup = build_status_page(entries, 0)
+        await send_throttled(update.message.reply_text, message, reply_markup=reply_markup)
+        return SEARCH
+
+    except transmission_rpc.error.TransmissionError as e:
+        logger.error("Transmission error: %s", e, exc_info=True)
+        reset_transmission()
+        await send_throttled(update.message.reply_text, f"❌ Failed to get Transmission status: {str(e)[:200]}...")
         return SEARCH
-        
     except Exception as e:
-        logger.error(f"Error getting Transmission status: {e}", exc_info=True)
-        await update.message.reply_text(f"❌ Failed to get Transmission status: {str(e)[:200]}...")
+        logger.error("Error getting Transmission status: %s", e, exc_info=True)
+        await send_throttled(update.message.reply_text, f"❌ Failed to get Transmission status: {str(e)[:200]}...")
         return SEARCH
 
+async def status_page(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Flip to another /status page by editing the existing message"""
+    query = update.callback_query
+    await query.answer()
+
+    entries = context.user_data.get('status_entries')
+    if not entries:
+        await send_throttled(query.edit_message_text, "Status expired. Send /status for a fresh listing.")
+        return
+
+    page = int(query.data.split(':', 1)[1])
+    message, reply_markup = build_status_page(entries, page)
+    await send_throttled(query.edit_message_text, message, reply_markup=reply_markup)
+
+async def flush_cache(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Flush the Jackett search cache"""
+    # Check if user is allowed
+    if not await check_user(update):
+        return ConversationHandler.END
+
+    username = update.effective_user.username
+    logger.info("Flush cache command received from %s", username)
+
+    jackett_cache.clear()
+    await send_throttled(update.message.reply_text, "Search cache flushed.")
+    return SEARCH
+
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     user_id = update.effective_user.id
     username = update.effective_user.username
     
-    logger.info(f"User {username} manually cancelled the operation")
+    logger.info("User %s manually cancelled the operation", username)
     
     # Clear any cached results for this user
     search_results_cache.pop(user_id, None)
     
-    await update.message.reply_text("Operation cancelled. Send me a search query when you're ready.")
+    await send_throttled(update.message.reply_text, "Operation cancelled. Send me a search query when you're ready.")
     return ConversationHandler.END
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -391,11 +583,11 @@ async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
     user_id = update.effective_user.id if update and update.effective_user else "Unknown"
     username = update.effective_user.username if update and update.effective_user else "Unknown"
     
-    logger.error(f"Error occurred for user {username} (ID: {user_id})")
+    logger.error("Error occurred for user %s (ID: %s)", username, user_id)
     
     # Send message to the user
     if update and update.effective_message:
-        await update.effective_message.reply_text(
+        await send_throttled(update.effective_message.reply_text,
             "Sorry, an error occurred while processing your request. Please try again later."
         )
 
@@ -415,15 +607,34 @@ def main() -> None:
         missing_vars.append("ALLOWED_TELEGRAM_USERS")
     
     if missing_vars:
-        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}. Exiting.")
+        logger.error("Missing required environment variables: %s. Exiting.", ', '.join(missing_vars))
         return
         
+    # Use uvloop when available for a faster event loop; optional dependency
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.info("uvloop not installed, using default asyncio event loop")
+
     logger.info("Starting Telegram Transmission Bot with Jackett integration")
-    logger.info(f"Current user: {os.environ.get('USER', 'unknown')}")
-    logger.info(f"Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info("Current user: %s", os.environ.get('USER', 'unknown'))
+    logger.info("Current time: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
 
-    # Create the Application and pass it your bot's token
-    application = ApplicationBuilder().token(TELEGRAM_TOKEN).build()
+    # Create the Application and pass it your bot's token.
+    # block=False dispatches handlers without serializing update processing,
+    # and concurrent_updates lets independent users' updates run in parallel
+    # (per-user state is safe: caches are keyed by user_id).
+    application = (
+        ApplicationBuilder()
+        .token(TELEGRAM_TOKEN)
+        .concurrent_updates(64)
+        .defaults(Defaults(block=False))
+        .post_init(start_sender)
+        .post_shutdown(close_http_session)
+        .build()
+    )
 
     # Set up the ConversationHandler
     conv_handler = ConversationHandler(
@@ -433,12 +644,17 @@ def main() -> None:
                 MessageHandler(filters.TEXT & ~filters.COMMAND, search_torrent),
                 CommandHandler("start", start),
                 CommandHandler("status", status),
+                CommandHandler("flushcache", flush_cache),
             ],
             SELECT_TORRENT: [CallbackQueryHandler(select_torrent)],
         },
         fallbacks=[CommandHandler("cancel", cancel)],
     )
 
+    # Register the status pager before the conversation handler so page flips
+    # are not swallowed by the SELECT_TORRENT callback handler
+    application.add_handler(CallbackQueryHandler(status_page, pattern=r"^status_page:\d+$"))
+
     # Register the conversation handler
     application.add_handler(conv_handler)
     